@@ -7,7 +7,7 @@ See project README.md for more details.
 from collections import namedtuple
 import math
 import logging
-from typing import Optional, Set, Dict
+from typing import Dict, Iterable, List, Optional, Set
 
 from . import exceptions
 
@@ -29,6 +29,8 @@ class WalkerNode:
         parent_id: ID of the parent node, if any
         first_child_id: ID of the leftmost child of this node, if any
     """
+    __slots__ = ("id", "is_leaf", "left_sibling_id", "right_sibling_id", "parent_id", "first_child_id")
+
     def __init__(
         self,
         node_id: str,
@@ -47,15 +49,19 @@ class WalkerNode:
 
 
 class _InternalNode(WalkerNode):
-    def __init__(self, node):
-        super().__init__(
-            node.id,
-            node.is_leaf,
-            node.left_sibling_id,
-            node.right_sibling_id,
-            node.parent_id,
-            node.first_child_id
-        )
+    # Only the positioning state is added here since the family links are already slots of 'WalkerNode'
+    __slots__ = ("prelim", "modifier", "left_neighbor", "point")
+
+    def __init__(
+        self,
+        node_id: str,
+        is_leaf: bool,
+        left_sibling_id: Optional[str],
+        right_sibling_id: Optional[str],
+        parent_id: Optional[str],
+        first_child_id: Optional[str],
+    ):
+        super().__init__(node_id, is_leaf, left_sibling_id, right_sibling_id, parent_id, first_child_id)
 
         # The current node's preliminary x-coordinate
         self.prelim = 0
@@ -66,8 +72,24 @@ class _InternalNode(WalkerNode):
         # Position coordinates of the node
         self.point = Point(0, 0)
 
-    def has_child(self):
-        return not self.is_leaf and self.first_child_id is not None
+    @classmethod
+    def from_node(cls, node: WalkerNode) -> "_InternalNode":
+        return cls(
+            node.id,
+            node.is_leaf,
+            node.left_sibling_id,
+            node.right_sibling_id,
+            node.parent_id,
+            node.first_child_id,
+        )
+
+    def relink(self, node: WalkerNode):
+        """Update the family links of this node in place from the given client-facing node."""
+        self.is_leaf = node.is_leaf
+        self.left_sibling_id = node.left_sibling_id
+        self.right_sibling_id = node.right_sibling_id
+        self.parent_id = node.parent_id
+        self.first_child_id = node.first_child_id
 
     def __str__(self):
         left_neighbor_id = self.left_neighbor and self.left_neighbor.id
@@ -91,8 +113,8 @@ class WalkerTree:
         max_y: float = math.inf,
     ):
         # The algorithm maintains a list of the previous node at each level i.e. the adjacent neighbor to the left.
-        # level_zero_ptr is a pointer to the first entry in this list.
-        self._level_zero_ptr = None
+        # This is a flat list indexed by level, where prev_nodes[0] is the entry for the apex of the tree.
+        self._prev_nodes: List[Optional[_InternalNode]] = []
         # Fixed distances used in the final walk of the tree to determine the absolute coordinates
         # of a node with respect to the apex node of the tree.
         self._x_top_adj = 0
@@ -127,6 +149,8 @@ class WalkerTree:
         # Tree is represented internally as a dict of Node ID to the Node object
         self._internal_node_dict: Dict[str, _InternalNode] = {}
         self._root_id = None
+        # IDs of nodes added or relinked since the last validation, see 'update_nodes'
+        self._unvalidated_ids: Set[str] = set()
         
     def root_id(self) -> str:
         """
@@ -157,24 +181,29 @@ class WalkerTree:
         if invalid_values:
             raise exceptions.InvalidTreeConfiguration("invalid values: {}".format(invalid_values))
 
-    def _get_leftmost(self, node, level, depth) -> Optional[_InternalNode]:
-        """This function returns the leftmost descendant of a node at a given depth.
-        This uses a postorder walk of the subtree under node, down to the level of depth.
-        'level' here is not the absolute tree level but the level below the node whose
-        leftmost descendant is being found.
+    def _resume_leftmost(self, stack, depth) -> Optional[_InternalNode]:
+        """This function finds the leftmost descendant of a node at a given depth, walking its subtree
+        from the given stack of (node, level) entries still to visit, where 'level' is not the
+        absolute tree level but the level below the node whose leftmost descendant is being found.
+        It returns the first node found at the given depth, if any.
+        The stack is left with the node found on top so that the walk can be resumed to find the
+        leftmost descendant at a greater depth: any node visited before it has no descendants at
+        that depth either, so there is no need to start over from the top of the subtree.
         """
-        if level >= depth:
-            return node
-        elif node.is_leaf:
-            return None
-        else:
-            right_most = self._get_node(node.first_child_id)
-            left_most = self._get_leftmost(right_most, level + 1, depth)
-            # Do a postorder walk of the subtree below node
-            while not left_most and right_most.right_sibling_id:
-                right_most = self._get_node(right_most.right_sibling_id)
-                left_most = self._get_leftmost(right_most, level + 1, depth)
-            return left_most
+        nodes = self._internal_node_dict
+        # Do a postorder walk of the subtree using an explicit stack rather than recursion.
+        # Each node's right sibling is pushed before its first child so that a subtree is fully
+        # searched before moving on to the siblings to its right.
+        while stack:
+            right_most, level = stack[-1]
+            if level >= depth:
+                return right_most
+            stack.pop()
+            if right_most.right_sibling_id:
+                stack.append((nodes[right_most.right_sibling_id], level))
+            if not right_most.is_leaf:
+                stack.append((nodes[right_most.first_child_id], level + 1))
+        return None
 
     def _apportion(self, node, level):
         """Cleans up the positioning of small sibling subtrees.
@@ -185,13 +214,21 @@ class WalkerTree:
         apportioned to smaller, interior subtrees, creating a pleasing
         aesthetic placement.
         """
-        log.debug("Apportion node: {}, level: {}".format(node, level))
-        left_most = self._get_node(node.first_child_id)
+        nodes = self._internal_node_dict
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug("Apportion node: %s, level: %s", node, level)
+        left_most = nodes[node.first_child_id]
+        # Pending walk of node's subtree used to find its leftmost descendants at increasing depths
+        leftmost_stack = None
+        # Bind settings used on every iteration to locals once
+        subtree_separation = self.subtree_separation
+        node_size = self.node_size
         neighbor = left_most.left_neighbor
         compare_depth = 1
         depth_to_stop = self.max_depth - level
 
-        while left_most and neighbor and compare_depth <= depth_to_stop:
+        while left_most is not None and neighbor is not None and compare_depth <= depth_to_stop:
             # Compute the location of leftmost and where it should be with respect to neighbor
             left_mod_sum = 0
             right_mod_sum = 0
@@ -199,118 +236,97 @@ class WalkerTree:
             ancestor_neighbor = neighbor
             for i in range(compare_depth):
                 if ancestor_left_most.parent_id:
-                    ancestor_left_most = self._get_node(ancestor_left_most.parent_id)
+                    ancestor_left_most = nodes[ancestor_left_most.parent_id]
                     right_mod_sum += ancestor_left_most.modifier
                 if ancestor_neighbor.parent_id:
-                    ancestor_neighbor = self._get_node(ancestor_neighbor.parent_id)
+                    ancestor_neighbor = nodes[ancestor_neighbor.parent_id]
                     left_mod_sum += ancestor_neighbor.modifier
             # Find the move distance and apply it to node's sub-tree
             # Add appropriate portions to smaller interior sub-trees
-            move_distance = (neighbor.prelim + left_mod_sum + self.subtree_separation + self.node_size) - (
+            move_distance = (neighbor.prelim + left_mod_sum + subtree_separation + node_size) - (
                 left_most.prelim + right_mod_sum
             )
-            log.debug(
-                "Move Distance = ({} + {} + {} + {}) - ({} + {}) = {}".format(
+            if debug:
+                log.debug(
+                    "Move Distance = (%s + %s + %s + %s) - (%s + %s) = %s",
                     neighbor.prelim,
                     left_mod_sum,
-                    self.subtree_separation,
-                    self.node_size,
+                    subtree_separation,
+                    node_size,
                     left_most.prelim,
                     right_mod_sum,
                     move_distance,
                 )
-            )
             if move_distance > 0:
+                # The ancestor neighbor is at the same level as node and to its left, so it is one of
+                # node's left siblings exactly when they share a parent. Comparing parents first avoids
+                # walking all of node's left siblings only to find that it is not among them.
+                if ancestor_neighbor.parent_id != node.parent_id:
+                    # No need to move anything
+                    # Needs to be done by an ancestor b/c ancestor neighbor and leftmost are not siblings
+                    return
                 # Count interior sibling sub-trees in left siblings
                 tmp = node
                 left_siblings = 0
-                while tmp and tmp != ancestor_neighbor:
+                while tmp is not ancestor_neighbor:
                     left_siblings += 1
-                    tmp = self._get_node(tmp.left_sibling_id) if tmp.left_sibling_id else None
-                if tmp:
-                    # Apply portions to appropriate left sibling sub-trees
-                    portion = move_distance / left_siblings
-                    tmp = node
-                    # NB: this line is wrong in the original paper as it is missing the negation
-                    # and without it, the move distances are not applied correctly to all subtrees.
-                    while tmp and tmp != ancestor_neighbor:
-                        log.debug("Applying move distance: {} to node: {}".format(move_distance, tmp))
-                        tmp.prelim += move_distance
-                        tmp.modifier += move_distance
-                        move_distance -= portion
-                        tmp = self._get_node(tmp.left_sibling_id) if tmp.left_sibling_id else None
-                else:
-                    # No need to move anything
-                    # Needs to be done by an ancestor b/c ancestor neighbor and leftmost are not siblings
-                    return
+                    tmp = nodes[tmp.left_sibling_id]
+                # Apply portions to appropriate left sibling sub-trees
+                portion = move_distance / left_siblings
+                tmp = node
+                # NB: this line is wrong in the original paper as it is missing the negation
+                # and without it, the move distances are not applied correctly to all subtrees.
+                while tmp is not ancestor_neighbor:
+                    if debug:
+                        log.debug("Applying move distance: %s to node: %s", move_distance, tmp)
+                    tmp.prelim += move_distance
+                    tmp.modifier += move_distance
+                    move_distance -= portion
+                    tmp = nodes[tmp.left_sibling_id]
             # Determine the leftmost descendant of node at the next
             # lower level to compare its positioning against that of its
             # neighbor.
             compare_depth += 1
             if left_most.is_leaf:
-                left_most = self._get_leftmost(node, 0, compare_depth)
+                # Find the leftmost descendant of node at compare_depth, resuming the previous walk
+                if leftmost_stack is None:
+                    leftmost_stack = [(nodes[node.first_child_id], 1)]
+                left_most = self._resume_leftmost(leftmost_stack, compare_depth)
             else:
-                left_most = self._get_node(left_most.first_child_id) if left_most.first_child_id else None
+                left_most = nodes[left_most.first_child_id] if left_most.first_child_id else None
 
             # NB: the original paper does not specify updating the neighbor, but this is
             # absolutely necessary to ensure that the neighbor stays in sync level-wise with
             # the leftmost node we are processing on the next iteration of the while loop.
-            neighbor = left_most and left_most.left_neighbor
+            neighbor = left_most.left_neighbor if left_most is not None else None
 
     # Initialize the list of previous nodes at each level.
     def _init_prev_node_list(self):
-        # Start with the node at level 0 - the apex of the tree
-        tmp = self._level_zero_ptr
-        while tmp:
-            tmp.prev_node = None
-            tmp = tmp.next_level
+        # Levels not yet in the list have no previous node, so an empty list is the same as
+        # resetting the previous node at every level
+        self._prev_nodes.clear()
 
     # Get the previous node at the given level
     def _get_prev_node(self, level):
-        # Start with the node at level 0 - the apex of the tree
-        tmp = self._level_zero_ptr
-        i = 0
-        while tmp:
-            if i == level:
-                return tmp.prev_node
-            tmp = tmp.next_level
-            i += 1
-        return None
-
-    # Private class used to track previous progress
-    class _NodeTracker:
-        def __init__(self, prev_node=None, next_level=None):
-            self.prev_node = prev_node
-            self.next_level = next_level
+        prev_nodes = self._prev_nodes
+        return prev_nodes[level] if level < len(prev_nodes) else None
 
     # Set an element in the list tracking previous nodes.
     def _set_prev_node(self, level, node):
-        if not self._level_zero_ptr:
-            self._level_zero_ptr = self._NodeTracker()
-            self._level_zero_ptr.prev_node = node
-            self._level_zero_ptr.next_level = None
+        prev_nodes = self._prev_nodes
+        if level < len(prev_nodes):
+            # At this level, replace the existing list element with the given node
+            prev_nodes[level] = node
             return
-
-        # Start with the node at level 0 - the apex of the tree
-        tmp = self._level_zero_ptr
-        i = 0
-        while tmp:
-            if i == level:
-                # At this level, replace the existing list element with
-                # the given node
-                tmp.prev_node = node
-                return
-            elif tmp.next_level is None:
-                # There isn't a list element yet at this level, so
-                # add one. The following instructions prepare the
-                # list element at the next level, not at this one.
-                new_node = self._NodeTracker()
-                new_node.prev_node = None
-                new_node.next_level = None
-                tmp.next_level = new_node
-            # Prepare to move to the next level, to look again.
-            tmp = tmp.next_level
-            i += 1
+        # There isn't a list element yet at this level (or any in between), so add them
+        prev_nodes.extend([None] * (level - len(prev_nodes)))
+        prev_nodes.append(node)
+
+    def _has_extents(self) -> bool:
+        """Returns whether any of the optional boundaries of the coordinate system are set."""
+        return not (
+            self.min_x == -math.inf and self.max_x == math.inf and self.min_y == -math.inf and self.max_y == math.inf
+        )
 
     def _check_extents_range(self, x, y):
         """Verifies that the passed x and y coordinates are within the coordinate system
@@ -330,36 +346,58 @@ class WalkerTree:
         x-coordinate (node.prelim). In addition, internal nodes are given modifiers,
         which will be used to move their offspring to the right (node.modifier).
         """
-        # Set pointer to previous node at this level
-        node.left_neighbor = self._get_prev_node(level)
-        # Update the previous node
-        self._set_prev_node(level, node)
-        # Set default modifier value
-        node.modifier = 0
-        log.debug("First walk, node: {}".format(node))
-        if node.is_leaf or level == self.max_depth:
-            if node.left_sibling_id:
-                # Determine the preliminary x-coordinate
-                node.prelim = self._get_node(node.left_sibling_id).prelim + self.sibling_separation + self.node_size
-            else:
-                # No sibling on left to worry about
-                node.prelim = 0
-        else:
-            # This node is not a leaf, so call this recursively for each of its offspring
-            left_most = right_most = self._get_node(node.first_child_id)
-            self._first_walk(left_most, level + 1)
-            while right_most.right_sibling_id:
-                right_most = self._get_node(right_most.right_sibling_id)
-                self._first_walk(right_most, level + 1)
-            midpoint = (left_most.prelim + right_most.prelim) / 2
-            if node.left_sibling_id:
-                node.prelim = self._get_node(node.left_sibling_id).prelim + self.sibling_separation + self.node_size
-                node.modifier = node.prelim - midpoint
-                self._apportion(node, level)
+        nodes = self._internal_node_dict
+        # Bind settings used for every node to locals once
+        sibling_separation = self.sibling_separation
+        node_size = self.node_size
+        max_depth = self.max_depth
+        # Logging is checked once per walk since a disabled debug call still costs a call per node
+        debug = log.isEnabledFor(logging.DEBUG)
+        # Walk the tree with an explicit stack rather than recursion so that the depth of the tree is
+        # not limited by the interpreter's recursion limit. Each entry is a node and its level, along
+        # with its leftmost and rightmost children once those have been pushed to be walked first.
+        stack = [(node, level, None, None)]
+        while stack:
+            node, level, left_most, right_most = stack.pop()
+            if left_most is not None:
+                # All offspring of this node have been walked, so it can now be positioned
+                midpoint = (left_most.prelim + right_most.prelim) / 2
+                if node.left_sibling_id:
+                    node.prelim = nodes[node.left_sibling_id].prelim + sibling_separation + node_size
+                    node.modifier = node.prelim - midpoint
+                    # Nothing to apportion unless there is a subtree to the left of the children
+                    if left_most.left_neighbor is not None:
+                        self._apportion(node, level)
+                else:
+                    node.prelim = midpoint
+                continue
+
+            # Set pointer to previous node at this level
+            node.left_neighbor = self._get_prev_node(level)
+            # Update the previous node
+            self._set_prev_node(level, node)
+            # Set default modifier value
+            node.modifier = 0
+            if debug:
+                log.debug("First walk, node: %s", node)
+            if node.is_leaf or level == max_depth:
+                if node.left_sibling_id:
+                    # Determine the preliminary x-coordinate
+                    node.prelim = nodes[node.left_sibling_id].prelim + sibling_separation + node_size
+                else:
+                    # No sibling on left to worry about
+                    node.prelim = 0
             else:
-                node.prelim = midpoint
-
-    def _second_walk(self, node, level, mod_sum):
+                # This node is not a leaf, so walk each of its offspring first, from left to right
+                right_most = nodes[node.first_child_id]
+                children = [right_most]
+                while right_most.right_sibling_id:
+                    right_most = nodes[right_most.right_sibling_id]
+                    children.append(right_most)
+                stack.append((node, level, children[0], right_most))
+                stack.extend((child, level + 1, None, None) for child in reversed(children))
+
+    def _second_walk(self, node, level, mod_sum, positions):
         """During a second preorder walk, each node is given a final x-coordinate
         by summing its preliminary x-coordinate and the modifiers of all the node's
         ancestors. The y-coordinate depends on the height of the tree. If the actual
@@ -368,92 +406,231 @@ class WalkerTree:
         immediately readjust all the nodes in the subtree, each node remembers the distance to
         the provisional place in a modifier field (node.modifier).
         In this second pass down the tree, modifiers are accumulated and applied to every node.
+        If given, the positions dict is updated with the final point of each node as well.
         """
-        if level > self.max_depth:
-            raise exceptions.MaxDepthExceeded(
-                "node: {} is at level: {}, which is greater than configured max depth: {}".format(
-                    node.id, level, self.max_depth
+        nodes = self._internal_node_dict
+        # Nothing can be out of range when no boundaries are set, which is the default, so the
+        # range check can be skipped for every node rather than comparing against infinities
+        check_extents = self._check_extents_range if self._has_extents() else None
+        # Bind settings and adjustments used for every node to locals once
+        x_top_adj = self._x_top_adj
+        y_top_adj = self._y_top_adj
+        level_separation = self.level_separation
+        max_depth = self.max_depth
+        debug = log.isEnabledFor(logging.DEBUG)
+        # Walk the tree with an explicit stack rather than recursion, see '_first_walk'. Each node's
+        # right sibling is pushed before its first child so that offspring are visited first.
+        stack = [(node, level, mod_sum)]
+        while stack:
+            node, level, mod_sum = stack.pop()
+            if level > max_depth:
+                raise exceptions.MaxDepthExceeded(
+                    "node: {} is at level: {}, which is greater than configured max depth: {}".format(
+                        node.id, level, max_depth
+                    )
                 )
-            )
-        x_tmp = self._x_top_adj + node.prelim + mod_sum
-        y_tmp = self._y_top_adj + (level * self.level_separation)
-        # Check if tree is out of draw range based on tmp coordinates
-        self._check_extents_range(x_tmp, y_tmp)
-
-        log.debug("Second walk, node: {}".format(node))
-        node.point = Point(x_tmp, y_tmp)
-        if node.first_child_id:
-            # Apply the modifier value to all offspring
-            self._second_walk(self._get_node(node.first_child_id), level + 1, mod_sum + node.modifier)
-        if node.right_sibling_id:
-            self._second_walk(self._get_node(node.right_sibling_id), level, mod_sum)
-        return
+            x_tmp = x_top_adj + node.prelim + mod_sum
+            y_tmp = y_top_adj + (level * level_separation)
+            # Check if tree is out of draw range based on tmp coordinates
+            if check_extents is not None:
+                check_extents(x_tmp, y_tmp)
+
+            if debug:
+                log.debug("Second walk, node: %s", node)
+            node.point = Point(x_tmp, y_tmp)
+            if positions is not None:
+                positions[node.id] = node.point
+            if node.right_sibling_id:
+                stack.append((nodes[node.right_sibling_id], level, mod_sum))
+            if node.first_child_id:
+                # Apply the modifier value to all offspring
+                stack.append((nodes[node.first_child_id], level + 1, mod_sum + node.modifier))
 
     def _get_node(self, node_id: str) -> _InternalNode:
         if not node_id:
             raise ValueError("must provide node ID")
-        if node_id not in self._internal_node_dict:
+        node = self._internal_node_dict.get(node_id)
+        if node is None:
             raise exceptions.NodeDoesNotExist("node ID: {}".format(node_id))
-        return self._internal_node_dict[node_id]
+        return node
+
+    def _validate_node(self, node: _InternalNode):
+        # Read each link once and fetch every linked node with a single lookup, which is reused for
+        # both the existence and the consistency checks below
+        node_id = node.id
+        parent_id = node.parent_id
+        left_sibling_id = node.left_sibling_id
+        right_sibling_id = node.right_sibling_id
+        first_child_id = node.first_child_id
+        if node.is_leaf:
+            if first_child_id:
+                raise exceptions.InvalidTree("leaf node: {} has first child: {}".format(node_id, first_child_id))
+        elif not first_child_id:
+            raise exceptions.InvalidTree("non-leaf node: {} has no first child".format(node_id))
+
+        # Ensure all IDs exist in tree
+        get_node = self._internal_node_dict.get
+        if get_node(node_id) is None:
+            raise exceptions.InvalidTree("node ID not in tree: {}".format(node_id))
+        if parent_id and get_node(parent_id) is None:
+            raise exceptions.InvalidTree("parent ID {} not in tree for node: {}".format(parent_id, node_id))
+        left_sibling = get_node(left_sibling_id) if left_sibling_id else None
+        if left_sibling_id and left_sibling is None:
+            raise exceptions.InvalidTree("left sibling ID {} not in tree for node: {}".format(left_sibling_id, node_id))
+        right_sibling = get_node(right_sibling_id) if right_sibling_id else None
+        if right_sibling_id and right_sibling is None:
+            raise exceptions.InvalidTree("right sibling ID {} not in tree for node: {}".format(right_sibling_id, node_id))
+        first_child = get_node(first_child_id) if first_child_id else None
+        if first_child_id and first_child is None:
+            raise exceptions.InvalidTree("first child ID {} not in tree for node: {}".format(first_child_id, node_id))
+
+        # Ensure siblings are consistent
+        if left_sibling is not None and left_sibling.right_sibling_id != node_id:
+            raise exceptions.InvalidTree(
+                "left sibling discrepancy: {} != {}".format(left_sibling.right_sibling_id, node_id)
+            )
+        if right_sibling is not None and right_sibling.left_sibling_id != node_id:
+            raise exceptions.InvalidTree(
+                "right sibling discrepancy: {} != {}".format(right_sibling.left_sibling_id, node_id)
+            )
+
+        # Ensure parent child is consistent
+        if first_child is not None and first_child.parent_id != node_id:
+            raise exceptions.InvalidTree("first child discrepancy: {}".format(node_id))
 
     def _validate_tree(self):
         orphan_node_ids = []
-        for _, node in self._internal_node_dict.items():
-            if node.is_leaf and node.first_child_id:
-                raise exceptions.InvalidTree("leaf node: {} has first child: {}".format(node.id, node.first_child_id))
+        validate_node = self._validate_node
+        for node in self._internal_node_dict.values():
+            validate_node(node)
             if node.parent_id is None:
                 orphan_node_ids.append(node.id)
 
-            # Ensure all IDs exist in tree
-            if node.id not in self._internal_node_dict:
-                raise exceptions.InvalidTree("node ID not in tree: {}".format(node.id))
-            if node.parent_id and node.parent_id not in self._internal_node_dict:
-                raise exceptions.InvalidTree("parent ID {} not in tree for node: {}".format(node.parent_id, node.id))
-            if node.left_sibling_id and node.left_sibling_id not in self._internal_node_dict:
-                raise exceptions.InvalidTree("left sibling ID {} not in tree for node: {}".format(node.left_sibling_id, node.id))
-            if node.right_sibling_id and node.right_sibling_id not in self._internal_node_dict:
-                raise exceptions.InvalidTree("right sibling ID {} not in tree for node: {}".format(node.right_sibling_id, node.id))
-            if node.first_child_id and node.first_child_id not in self._internal_node_dict:
-                raise exceptions.InvalidTree("first child ID {} not in tree for node: {}".format(node.first_child_id, node.id))
-
-            # Ensure siblings are consistent
-            if node.left_sibling_id:
-                left_sibling = self._internal_node_dict[node.left_sibling_id]
-                lefts_right = left_sibling.right_sibling_id
-                if lefts_right != node.id:
-                    raise exceptions.InvalidTree("left sibling discrepancy: {} != {}".format(lefts_right, node.id))
-            if node.right_sibling_id:
-                right_sibling = self._internal_node_dict[node.right_sibling_id]
-                rights_left = right_sibling.left_sibling_id
-                if rights_left != node.id:
-                    raise exceptions.InvalidTree("right sibling discrepancy: {} != {}".format(rights_left, node.id))
-
-            # Ensure parent child is consistent
-            if node.first_child_id:
-                first_child = self._internal_node_dict[node.first_child_id]
-                if first_child.parent_id != node.id:
-                    raise exceptions.InvalidTree("first child discrepancy: {}".format(node.id))
-
         # Ensure only one root node is missing parent and set parent if valid
         if len(orphan_node_ids) != 1:
             raise exceptions.InvalidTree("invalid number of nodes with no parent: {}".format(orphan_node_ids))
         else:
             self._root_id = orphan_node_ids[0]
+        self._unvalidated_ids.clear()
+
+    def _validate_edits(self):
+        """Validates only the nodes touched by edits since the last validation, which is enough to
+        keep the tree consistent as long as the rest of it was validated when populated: these are
+        the nodes added or relinked and the nodes that were linked to any node removed.
+        Besides the checks of '_validate_node', each of them must be reachable from the root, i.e. be
+        either the root, its parent's first child or the right sibling of another node.
+        """
+        get_node = self._internal_node_dict.get
+        for node_id in self._unvalidated_ids:
+            node = self._get_node(node_id)
+            self._validate_node(node)
+            parent_id = node.parent_id
+            if parent_id is None:
+                if node_id != self._root_id:
+                    raise exceptions.InvalidTree("node: {} has no parent but is not the root".format(node_id))
+            elif not node.left_sibling_id and get_node(parent_id).first_child_id != node_id:
+                raise exceptions.InvalidTree(
+                    "node: {} is neither the first child of parent: {} nor has a left sibling".format(
+                        node_id, parent_id
+                    )
+                )
+        self._unvalidated_ids.clear()
 
-    def populate_tree(self, nodes: Set[WalkerNode]):
-        """This method populates the tree with the given set of nodes.
+    def populate_tree(self, nodes: Iterable[WalkerNode]):
+        """This method populates the tree with the given nodes, e.g. a list. Each node ID must be
+        unique, so there is no need to pass a set, which would only add the cost of hashing each node.
         Note: this merely establishes the set of nodes to process and validates the tree state.
         Node positions will not be updated until 'position_tree' is called.
         """
         for node in nodes:
-            self._internal_node_dict[node.id] = _InternalNode(node)
+            self._internal_node_dict[node.id] = _InternalNode.from_node(node)
+        self._validate_tree()
+
+    def populate_tree_arrays(
+        self,
+        node_ids: List[str],
+        is_leaf: List[bool],
+        parent: List[int],
+        first_child: List[int],
+        left_sibling: List[int],
+        right_sibling: List[int],
+    ):
+        """This method populates the tree from parallel lists (struct of arrays) describing the nodes,
+        where node i has ID node_ids[i] and its family links are given as indices into node_ids, with
+        -1 standing in for no such node. This is equivalent to 'populate_tree' but spares callers
+        building large trees the cost of creating a 'WalkerNode' object per node.
+        """
+        n = len(node_ids)
+        if not (len(is_leaf) == len(parent) == len(first_child) == len(left_sibling) == len(right_sibling) == n):
+            raise exceptions.InvalidTree("node arrays must all be the same length as node_ids: {}".format(n))
+        internal_node_dict = self._internal_node_dict
+        for node_id, leaf, p, fc, ls, rs in zip(node_ids, is_leaf, parent, first_child, left_sibling, right_sibling):
+            internal_node_dict[node_id] = _InternalNode(
+                node_id,
+                leaf,
+                node_ids[ls] if ls >= 0 else None,
+                node_ids[rs] if rs >= 0 else None,
+                node_ids[p] if p >= 0 else None,
+                node_ids[fc] if fc >= 0 else None,
+            )
         self._validate_tree()
 
-    def position_tree(self):
+    def has_node(self, node_id: str) -> bool:
+        """This method returns whether a node with the given ID is currently in the tree."""
+        return node_id in self._internal_node_dict
+
+    def update_nodes(self, nodes: Iterable[WalkerNode]):
+        """This method adds the given nodes to the tree, or relinks them in place if they are already
+        in it, which allows small edits to be applied without repopulating the whole tree.
+        Note: edited nodes are only validated once 'position_tree' is called, so edits that span
+        several nodes can be applied in any order, e.g. when adding a node along with its children.
+        """
+        for node in nodes:
+            internal = self._internal_node_dict.get(node.id)
+            if internal is None:
+                self._internal_node_dict[node.id] = _InternalNode.from_node(node)
+            else:
+                internal.relink(node)
+            self._unvalidated_ids.add(node.id)
+
+    def set_first_child(self, parent_id: str, first_child_id: Optional[str]):
+        """This method sets the first child of the given node in place, which also determines whether
+        it is a leaf. See 'update_nodes' regarding validation.
+        """
+        parent = self._get_node(parent_id)
+        parent.first_child_id = first_child_id
+        parent.is_leaf = first_child_id is None
+        self._unvalidated_ids.add(parent_id)
+
+    def remove_nodes(self, node_ids: Iterable[str]):
+        """This method removes the nodes with the given IDs from the tree. The caller is expected to
+        relink the parents and siblings of the removed nodes before repositioning, and the nodes that
+        were linked to them are validated again at that point. See 'update_nodes' regarding validation.
+        """
+        # Materialize the IDs first since they are checked for the root before being removed
+        node_ids = set(node_ids)
+        if self._root_id in node_ids:
+            raise exceptions.InvalidTree("cannot remove root node: {}".format(self._root_id))
+        internal_node_dict = self._internal_node_dict
+        unvalidated_ids = self._unvalidated_ids
+        for node_id in node_ids:
+            node = internal_node_dict.pop(node_id, None)
+            if node is not None:
+                unvalidated_ids.update(
+                    filter(None, (node.parent_id, node.left_sibling_id, node.right_sibling_id, node.first_child_id))
+                )
+        # Nodes linked to each other may have been removed together, so drop them only once all are gone
+        unvalidated_ids.difference_update(node_ids)
+
+    def position_tree(self, positions: Optional[Dict[str, Point]] = None):
         """This method determines the coordinates for each node in a tree.
         This assumes that the x and y coordinates of the apex node are already set as desired,
         since the tree underneath it will be positioned with respect to those coordinates.
 
+        If a positions dict is given, the final Point of every node is also written into it keyed by
+        node ID, which spares callers that need all positions a 'get_position' call per node. Note
+        that entries for nodes that have since been removed are left for the caller to drop.
+
         Tree repositioning is left decoupled from adding or removing nodes to allow for those actions
         to be done in bulk without incurring the costs of repositioning.
         """
@@ -462,6 +639,8 @@ class WalkerTree:
 
         if not self._root_id:
             raise exceptions.UnidentifiedRootNode("must have root node id before positioning")
+        if self._unvalidated_ids:
+            self._validate_edits()
         root = self._get_node(self._root_id)
         if not root:
             raise exceptions.InvalidTree("must have root node before positioning")
@@ -474,10 +653,10 @@ class WalkerTree:
         # Adjust all nodes with respect to root
         self._x_top_adj = root.point.x - root.prelim
         self._y_top_adj = root.point.y
-        log.debug("Adjustments: x_top_adj: {}, y_top_adj: {}".format(self._x_top_adj, self._y_top_adj))
+        log.debug("Adjustments: x_top_adj: %s, y_top_adj: %s", self._x_top_adj, self._y_top_adj)
 
         # Set final positioning with preorder walk
-        self._second_walk(root, 0, 0)
+        self._second_walk(root, 0, 0, positions)
 
     def get_position(self, node_id: str) -> Point:
         """This method returns a Point(x, y) representation of the position for the given node.
@@ -494,3 +673,13 @@ class WalkerTree:
 
         node = self._get_node(node_id)
         return node.point
+
+    def get_all_positions(self) -> Dict[str, Point]:
+        """This method returns a dict of node ID to the Point(x, y) position of every node in the tree,
+        which is cheaper than calling 'get_position' for each node. The same caveat applies in that
+        positions are only updated once 'position_tree' is called.
+        """
+        if len(self._internal_node_dict) == 0:
+            raise exceptions.InvalidTree("empty tree; tree must be populated before positioning")
+
+        return {node_id: node.point for node_id, node in self._internal_node_dict.items()}
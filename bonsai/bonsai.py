@@ -1,6 +1,10 @@
 import logging
+from array import array
+from collections import deque
 from dataclasses import dataclass
-from typing import DefaultDict, List, Tuple
+from itertools import accumulate, chain, count, starmap
+from operator import attrgetter
+from typing import DefaultDict, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from ._walker_tree import WalkerTree, WalkerNode, Point
 from .exceptions import *
@@ -8,8 +12,12 @@ from .exceptions import *
 
 log = logging.getLogger(__name__)
 
+# Position reported for nodes the 'Walker Tree' has not positioned yet, which only happens when the
+# last reposition failed part way (e.g. 'MaxDepthExceeded'); same as an unpositioned walker node
+_UNPOSITIONED = Point(0, 0)
 
-@dataclass
+
+@dataclass(slots=True)
 class Node:
     """
     Node is the basic unit of the tree and is used for both input and output.
@@ -23,6 +31,9 @@ class Node:
             - NOTE: y is inverted, so zero is the top of the tree and positive values go down.
             - Also note that the y-coordinate in Point input is not important as it is recomputed.
         _is_leaf (bool): For internal use, no need to input, hence the underscore and default.
+
+    Nodes are declared with slots since trees can hold many of them, which keeps each instance
+    smaller and attribute access faster, but means no other attributes can be set on them.
     """
     id: str
     pos: Point
@@ -51,6 +62,27 @@ class Config:
     node_size: int = 250
 
 
+def _fill_family_links(
+    group_parents: List[int], group_starts: List[int], n: int
+) -> Tuple[List[int], List[int], List[int], List[int]]:
+    """
+    Compute the parent, first child, left sibling and right sibling links (indices, or -1 if there is
+    no such node) of n nodes whose child groups are laid out contiguously as described by the given
+    CSR-style offsets. Each group is filled with slice assignments so the per-node work happens in C
+    rather than in the interpreter.
+    """
+    parent = [-1] * n
+    first_child = [-1] * n
+    left_sibling = [-1] * n
+    right_sibling = [-1] * n
+    for p_idx, start, end in zip(group_parents, group_starts, group_starts[1:]):
+        first_child[p_idx] = start
+        parent[start:end] = [p_idx] * (end - start)
+        left_sibling[start + 1:end] = range(start, end - 1)
+        right_sibling[start:end - 1] = range(start + 1, end)
+    return parent, first_child, left_sibling, right_sibling
+
+
 class Bonsai:
     # The input is a dict of Parent Node ID to the list of child nodes,
     # where each child node is an instance of 'InputNode'.
@@ -58,71 +90,248 @@ class Bonsai:
         # _parent_id_to_children: main tree structure for tracking tree state
         self._parent_id_to_children = tree
         self._validate()
-        # Mark all leaf nodes in the tree
-        self._mark_leaves()
+        # _child_id_to_parent_id: reverse index of our main tree structure for O(1) parent lookups
+        self._child_id_to_parent_id: Dict[str, str] = {}
+        # _child_id_to_node: index of every non-root node by ID for O(1) updates to its attributes
+        self._child_id_to_node: Dict[str, Node] = {}
+        # Index all nodes and mark the leaves in the tree
+        self._index_nodes()
+        # _child_index: position of each node within its parent's (sorted) children list
+        self._child_index: Dict[str, int] = {}
+        # _synced_links: family links last pushed to the 'Walker Tree' for each node, keyed by node ID
+        self._synced_links: Dict[str, Tuple[bool, Optional[str], Optional[str], str, Optional[str]]] = {}
+        # _dirty_parents: parents whose children changed since the 'Walker Tree' was last synced
+        self._dirty_parents: Set[str] = set()
+        # _removed_ids: nodes pruned since the 'Walker Tree' was last synced
+        self._removed_ids: Set[str] = set()
+        # _positions: latest position of every node, written directly by the 'Walker Tree'. The
+        # entries are the very 'Point' objects computed by the walker tree, shared rather than copied,
+        # which is safe since points are immutable
+        self._positions: Dict[str, Point] = {}
+        # _nodes_cache: (id, pos, is_leaf) of every node in 'list_nodes' order, kept until the tree is
+        # next edited. Only immutable data is cached since the returned 'Node' objects are the caller's
+        self._nodes_cache: Optional[List[Tuple[str, Point, bool]]] = None
         # _w_tree: instance of 'Walker Tree' built from our main tree
+        self._w_tree: Optional[WalkerTree] = None
         self._w_tree_config = config
+        # _root_id_cache: the root only needs to be found once since edits can never replace it
+        # ('add_leaf' always adds below an existing node and the root cannot be pruned)
+        self._root_id_cache: Optional[str] = self._find_root_id() if tree else None
         self._w_tree_setup()
-        self._w_tree.position_tree()
+        self._w_tree.position_tree(self._positions)
         
     def _validate(self):
-        for p_id in self._parent_id_to_children.keys():
-            if type(p_id) != str:
-                raise ValueError("Node IDs must be strings")
+        if not all(isinstance(p_id, str) for p_id in self._parent_id_to_children):
+            raise ValueError("Node IDs must be strings")
+        all_children = chain.from_iterable(self._parent_id_to_children.values())
+        if not all(isinstance(child.id, str) for child in all_children):
+            raise ValueError("Node IDs must be strings")
         
     # Repositioning the 'Bonsai' tree covers all the high-level repeat work
     # needed each time the tree is updated, which includes:
-    # - Reconstructing the underlying 'Walker Tree'
+    # - Syncing the underlying 'Walker Tree' with the edited parts of the tree
     # - Repositioning the 'Walker Tree' nodes
-    # - Updating the positions of all Bonsai nodes
+    # Note that the 'Walker Tree' is only built from scratch once on initialization, after which
+    # edits are applied to it in place so that the cost of an edit scales with the number of
+    # siblings touched rather than the size of the whole tree.
+    # Layout only depends on the tree structure, so when no edits are pending there is nothing to do.
+    # Repositioning cannot be narrowed to a dirty subtree, however: parents are centered over their
+    # children all the way up to the root (which stays fixed), and apportioning compares subtrees
+    # against everything to their left, so a single edit can shift nodes anywhere in the tree.
     def _reposition(self):
-        self._mark_leaves()
-        self._w_tree_setup()
-        self._w_tree.position_tree()
+        if not self._dirty_parents and not self._removed_ids:
+            return
+        self._apply_deltas()
+        self._w_tree.position_tree(self._positions)
+
+    def _reposition_after_error(self):
+        """
+        Reposition the tree after a batch edit failed part way, so that the edits applied before the
+        failure are positioned. Any error repositioning is logged rather than raised, since the caller
+        is about to re-raise the original error, which it would otherwise hide.
+        """
+        try:
+            self._reposition()
+        except Exception:
+            log.exception("Failed to reposition tree after a failed edit")
+
+    def _apply_deltas(self):
+        """
+        Apply all pending edits to the existing 'Walker Tree' by dropping the pruned nodes and
+        relinking the children of each dirty parent. Dirty parents that are new to the walker tree
+        (e.g. a new leaf that has since been given children) are relinked right after their own
+        parent adds them.
+        """
+        if self._removed_ids:
+            self._w_tree.remove_nodes(self._removed_ids)
+            for node_id in self._removed_ids:
+                self._synced_links.pop(node_id, None)
+                self._positions.pop(node_id, None)
+            self._removed_ids = set()
+        dirty = self._dirty_parents
+        stack = [p_id for p_id in dirty if self._w_tree.has_node(p_id)]
+        while stack:
+            parent_id = stack.pop()
+            if parent_id not in dirty:
+                continue
+            dirty.discard(parent_id)
+            children = self._apply_delta(parent_id)
+            stack.extend(c.id for c in children if c.id in dirty)
+        # Anything left over was pruned after being marked dirty
+        dirty.clear()
+
+    def _apply_delta(self, parent_id: str) -> List[Node]:
+        """
+        Relink the children of a single parent in the 'Walker Tree' and return those children.
+        Only children whose family links differ from the ones last synced are pushed to the walker
+        tree, which for a single edit is just the node added or removed and its direct neighbors.
+        """
+        # Bind lookups used on every iteration to locals once
+        get_children = self._parent_id_to_children.get
+        get_synced = self._synced_links.get
+        synced_links = self._synced_links
+        walker_node = WalkerNode
+        children = get_children(parent_id, [])
+        # Pad the sibling IDs with None on both ends so the siblings of the child at index i are
+        # always at padded_ids[i] and padded_ids[i + 2], without branching on the boundaries
+        padded_ids = [None, *map(attrgetter("id"), children), None]
+        nodes: List[WalkerNode] = []
+        append = nodes.append
+        for i, child in enumerate(children):
+            child_id = padded_ids[i + 1]
+            left_sibling_id = padded_ids[i]
+            right_sibling_id = padded_ids[i + 2]
+            children_of_child = get_children(child_id)
+            first_child_id = children_of_child[0].id if children_of_child else None
+            links = (child._is_leaf, left_sibling_id, right_sibling_id, parent_id, first_child_id)
+            if get_synced(child_id) == links:
+                continue
+            synced_links[child_id] = links
+            append(walker_node(child_id, child._is_leaf, left_sibling_id, right_sibling_id, parent_id, first_child_id))
+        self._w_tree.update_nodes(nodes)
+        self._w_tree.set_first_child(parent_id, children[0].id if children else None)
+        return children
 
     def list_nodes(self) -> List[Node]:
         """
         Return a simple list of all tree nodes with minimal data required for positioning.
+        The node data is cached until the tree is next edited, so repeated calls in between skip the
+        traversal but still return new 'Node' objects that the caller is free to modify.
+        """
+        if self._nodes_cache is None:
+            get_position = self._positions.get
+            self._nodes_cache = [
+                (node_id, get_position(node_id, _UNPOSITIONED), is_leaf)
+                for node_id, is_leaf in self._iter_node_ids()
+            ]
+        return list(starmap(Node, self._nodes_cache))
+
+    def iter_nodes(self) -> Iterator[Node]:
+        """
+        Lazily yield all tree nodes in the same order as 'list_nodes', without materializing a list.
+        Useful for callers that only need a single pass over the nodes, e.g. to render or serialize
+        them. Note: the tree must not be edited while iterating.
+        """
+        get_position = self._positions.get
+        for node_id, is_leaf in self._iter_node_ids():
+            yield Node(id=node_id, pos=get_position(node_id, _UNPOSITIONED), _is_leaf=is_leaf)
+
+    def list_positions(self) -> Tuple[List[str], array, array, bytearray]:
+        """
+        Return the IDs, x-coordinates, y-coordinates and leaf flags of all tree nodes as parallel
+        sequences (struct of arrays) in the same order as 'list_nodes'. Useful for callers that feed
+        the positions straight into rendering or serialization, since no 'Node' is created per node
+        and the coordinates are packed into contiguous double arrays.
+        """
+        get_position = self._positions.get
+        ids: List[str] = []
+        is_leaf = bytearray()
+        add_id = ids.append
+        add_is_leaf = is_leaf.append
+        for node_id, leaf in self._iter_node_ids():
+            add_id(node_id)
+            add_is_leaf(leaf)
+        points = [get_position(node_id, _UNPOSITIONED) for node_id in ids]
+        xs = array("d", map(attrgetter("x"), points))
+        ys = array("d", map(attrgetter("y"), points))
+        return ids, xs, ys, is_leaf
+
+    def _iter_node_ids(self) -> Iterator[Tuple[str, bool]]:
         """
-        nodes: List[Node] = []
-        # Build up list of all Node types with positions from walker tree
+        Yield the ID and leaf flag of every tree node once, in the order shared by 'list_nodes',
+        'iter_nodes' and 'list_positions'.
+        """
+        # Walk each parent and its children, skipping nodes already seen
+        # (each parent is also the child of another parent unless it is the root)
+        seen: Set[str] = set()
+        mark_seen = seen.add
         for parent_id, children in self._parent_id_to_children.items():
-            pos = self._w_tree.get_position(parent_id)
-            p_node = Node(id=parent_id, pos=pos, _is_leaf=False)
-            nodes.append(p_node) if p_node not in nodes else None
+            if parent_id not in seen:
+                mark_seen(parent_id)
+                yield parent_id, False
             for child in children:
-                pos = self._w_tree.get_position(child.id)
-                c_node = Node(id=child.id, pos=pos, _is_leaf=child._is_leaf)
-                nodes.append(c_node) if c_node not in nodes else None
-            
-        return nodes
+                child_id = child.id
+                if child_id not in seen:
+                    mark_seen(child_id)
+                    yield child_id, child._is_leaf
 
     def add_leaf(self, node_id: str, parent_id: str):
         """
         Adds a node to the tree as a new leaf node to the parent specified in the input. Once added,
-        the tree is repositioned to ensure correct spacing. A small optimization could be to more
-        minimally reposition the tree when the new node sits on the far left or right edges of the
-        tree but does not seem worth the special-casing complexity at the moment.
-        Note: the new leaf is always added to the right of all existing siblings.
-        """
-        rightmost_sibling_x = 0
-        for sibling in self._parent_id_to_children[parent_id]:
-            rightmost_sibling_x = max(rightmost_sibling_x, sibling.pos.x)
-            if sibling.id == node_id:
-                raise ValueError("Node already exists in tree")
+        the tree is repositioned to ensure correct spacing. Even a leaf added on the far right edge of
+        the tree cannot simply be placed next to its left sibling: its parent is re-centered over the
+        wider set of children, which moves the parent, its siblings and its ancestors' subtrees too.
+        Note: the new leaf is always added to the right of all existing siblings, so only the new leaf
+        and its left sibling are relinked in the 'Walker Tree' rather than rebuilding it. Positions are
+        still recomputed for the whole tree since centering the parent can shift any node up to the root.
+        """
+        self._add_leaf(node_id, parent_id)
+        self._reposition()
+
+    def add_leaves(self, leaves: Iterable[Tuple[str, str]]):
+        """
+        Adds each (node ID, parent ID) pair as a new leaf in the given order, the same as calling
+        'add_leaf' for each of them, but repositions the tree only once at the end. A leaf may be
+        added under one added earlier in the same call. If adding a leaf fails, the leaves before it
+        are kept and the tree is still repositioned before the error is raised.
+        """
+        try:
+            for node_id, parent_id in leaves:
+                self._add_leaf(node_id, parent_id)
+        except Exception:
+            self._reposition_after_error()
+            raise
+        self._reposition()
+
+    def _add_leaf(self, node_id: str, parent_id: str):
+        """
+        Add a new leaf to all tree data structures without repositioning the tree.
+        """
+        self._nodes_cache = None
+        # Node IDs must be unique across the whole tree, not just among siblings
+        if self._has_node(node_id):
+            raise ValueError("Node already exists in tree")
+        if not self._has_node(parent_id):
+            raise NodeDoesNotExist("parent ID: {}".format(parent_id))
+
+        # Children are kept ordered by x (see '_w_tree_setup'), so the rightmost sibling is the last
+        siblings = self._parent_id_to_children[parent_id]
+        rightmost_sibling_x = max(0, siblings[-1].pos.x) if siblings else 0
         
         # Update tree data structures
-        self._parent_id_to_children[parent_id].append(
-            Node(
-                id=node_id,
-                pos=Point(rightmost_sibling_x + 1, 0),
-                _is_leaf=True,
-            )
+        self._child_index[node_id] = len(siblings)
+        node = Node(
+            id=node_id,
+            pos=Point(rightmost_sibling_x + 1, 0),
+            _is_leaf=True,
         )
+        siblings.append(node)
+        self._child_id_to_parent_id[node_id] = parent_id
+        self._child_id_to_node[node_id] = node
         # Since we've added a leaf, we need to make sure to update the parent
         # node as no longer being a leaf node.
         self._update_is_leaf(parent_id, False)
-        self._reposition()
+        self._dirty_parents.add(parent_id)
 
     def prune(self, node_id: str):
         """
@@ -130,9 +339,37 @@ class Bonsai:
         the tree. This is a little less trivial than it sounds due to the care needed to ensure that
         all internal data structures are updated correctly prior to repositioning.
         """
+        self._prune(node_id)
+        # Reposition the tree after all subtree nodes have been deleted
+        self._reposition()
+
+    def prune_many(self, node_ids: Iterable[str]):
+        """
+        Removes each of the given nodes along with its entire subtree, the same as calling 'prune' for
+        each of them, but repositions the tree only once at the end. Nodes that were already removed
+        as part of the subtree of a node pruned earlier in the same call are skipped. If pruning a node
+        fails, the nodes before it stay pruned and the tree is still repositioned before the error is
+        raised.
+        """
+        try:
+            for node_id in node_ids:
+                if node_id in self._removed_ids:
+                    continue
+                self._prune(node_id)
+        except Exception:
+            self._reposition_after_error()
+            raise
+        self._reposition()
+
+    def _prune(self, node_id: str):
+        """
+        Remove a node and its entire subtree from all tree data structures without repositioning
+        the tree.
+        """
         # Ensure we're not trying to prune the root node
-        if node_id == self._root_id():
+        if node_id == self._root_id_cache:
             raise CannotPruneRoot("Cannot prune root node")
+        self._nodes_cache = None
         
         # Find parent ID
         node_parent_id = self._find_parent_id(node_id)
@@ -140,98 +377,110 @@ class Bonsai:
         # Starting from the node to be deleted, queue up all children to be deleted
         # in a breadth-first manner. While queue is not empty, pop the first element
         # and add its children to queue before deleting that node from all structures.
-        queue: List[Tuple[str, str]] = [(node_id, node_parent_id)]
+        # A deque is used so that popping from the front does not shift the whole queue. Only node
+        # IDs are queued since the parent of each is still indexed until that node is deleted.
+        child_id_to_parent_id = self._child_id_to_parent_id
+        get_children = self._parent_id_to_children.get
+        queue: Deque[str] = deque([node_id])
         while queue:
-            n_id, p_id = queue.pop(0)
-            for child in self._parent_id_to_children[n_id]:
-                queue.append((child.id, n_id))
-            self._delete_node(n_id, p_id)
+            n_id = queue.popleft()
+            queue.extend(map(attrgetter("id"), get_children(n_id, ())))
+            self._delete_node(n_id, child_id_to_parent_id[n_id])
+            self._removed_ids.add(n_id)
             
         # Re-evaluate whether the deleted node's parent is now a leaf node, which
         # is true if it has no children left.
-        if len(self._parent_id_to_children[node_parent_id]) == 0:
+        if not self._parent_id_to_children[node_parent_id]:
             self._update_is_leaf(node_parent_id, True)
             # Remove parent key from our main structure as it is no longer a
             # parent if it has no children but ignore it if it's the root node.
             # The root node must stay in order to not pass an empty tree
             # structure downstream as that is invalid since there should be no
             # valid use-case for a tree with no nodes.
-            if node_parent_id != self._w_tree.root_id():
+            if node_parent_id != self._root_id_cache:
                 del self._parent_id_to_children[node_parent_id]
-                
-        # Reposition the tree after all subtree nodes have been deleted
-        self._reposition()
+        self._dirty_parents.add(node_parent_id)
         
+    def _has_node(self, node_id: str) -> bool:
+        # Every node other than the root is indexed by its parent
+        return node_id in self._child_id_to_parent_id or node_id == self._root_id_cache
+
     def _find_parent_id(self, node_id: str) -> str:
-        for parent_id, children in self._parent_id_to_children.items():
-            for child in children:
-                if child.id == node_id:
-                    return parent_id
-        raise InvalidTree("No parent ID found for node ID: %s" % node_id)
-        
-    def _mark_leaves(self):
-        for children in self._parent_id_to_children.values():
+        parent_id = self._child_id_to_parent_id.get(node_id)
+        if parent_id is None:
+            raise InvalidTree("No parent ID found for node ID: %s" % node_id)
+        return parent_id
+
+    def _index_nodes(self):
+        """
+        Fill the reverse indexes of our main tree structure and mark every leaf node, all in a single
+        pass over the children of each parent.
+        """
+        parent_id_to_children = self._parent_id_to_children
+        child_id_to_parent_id = self._child_id_to_parent_id
+        child_id_to_node = self._child_id_to_node
+        for parent_id, children in parent_id_to_children.items():
             for child in children:
-                child._is_leaf = child.id not in self._parent_id_to_children
+                child_id = child.id
+                child._is_leaf = child_id not in parent_id_to_children
+                child_id_to_parent_id[child_id] = parent_id
+                child_id_to_node[child_id] = child
        
     def _update_is_leaf(self, node_id: str, is_leaf: bool):
         """
-        Update the 'is_leaf' attribute of a node in the tree.
+        Update the 'is_leaf' attribute of a node in the tree. The root is not a child of any node so
+        it has no 'Node' to update and is left alone.
         """
-        for parent_id, children in self._parent_id_to_children.items():
-            for i, child in enumerate(children):
-                if child.id == node_id:
-                    self._parent_id_to_children[parent_id][i]._is_leaf = is_leaf
-                    return
+        node = self._child_id_to_node.get(node_id)
+        if node is not None:
+            node._is_leaf = is_leaf
         
     def _delete_node(self, node_id: str, node_parent_id: str):
         """
         Delete a single node from the tree along with its parent-child relationships.
         """
-        # First remove node from any children lists in _input_tree
-        for p_id, children in self._parent_id_to_children.items():
-            if p_id != node_parent_id:
-                continue
-            self._parent_id_to_children[p_id] = [c for c in children if c.id != node_id]
+        # First remove node from its parent's children list using the cached position, shifting
+        # the positions of the siblings to its right. The parent's list may already be gone when
+        # deleting the descendants of a pruned node, in which case there is nothing to splice.
+        siblings = self._parent_id_to_children.get(node_parent_id)
+        i = self._child_index.pop(node_id, None)
+        if siblings is not None and i is not None:
+            del siblings[i]
+            for sibling in siblings[i:]:
+                self._child_index[sibling.id] -= 1
 
         # Remove node as parent from keys of _input_tree
-        if node_id in self._parent_id_to_children:
-            del self._parent_id_to_children[node_id]
+        self._parent_id_to_children.pop(node_id, None)
+        self._child_id_to_parent_id.pop(node_id, None)
+        self._child_id_to_node.pop(node_id, None)
 
     def _root_is_leaf(self):
         if len(self._parent_id_to_children) == 0:
             raise ValueError("Invalid tree: no nodes found")
        
-        return not self._parent_id_to_children[self._root_id()]
-
-    def _root_id(self):
-        try:
-            if self._w_tree:
-                return self._w_tree.root_id()
-        except UnidentifiedRootNode:
-            pass
-        
-        # Collect all children into a set
-        child_ids = set(c.id for children in self._parent_id_to_children.values() for c in children)
+        return not self._parent_id_to_children[self._root_id_cache]
 
-        # Identify potential root IDs i.e. those not in children set
-        root_ids = [id for id in self._parent_id_to_children if id not in child_ids]
+    def _find_root_id(self) -> str:
+        # This only runs once on initialization (see '_root_id_cache'), before the 'Walker Tree' is
+        # populated, so the root always has to be found from our main tree structure.
+        # Identify potential root IDs i.e. parent IDs that are not the child of any other node, in a
+        # single set difference over all children rather than building an intermediate set of them
+        all_children = chain.from_iterable(self._parent_id_to_children.values())
+        root_ids = set(self._parent_id_to_children).difference(map(attrgetter("id"), all_children))
 
         # Error handling based on the number of potential roots
         if len(root_ids) == 1:
-            return root_ids[0]
+            return next(iter(root_ids))
         elif len(root_ids) > 1:
-            log.error("Multiple root nodes found in tree: %s", root_ids)
+            log.error("Multiple root nodes found in tree: %s", sorted(root_ids))
             raise ValueError("Invalid tree input: multiple root nodes found")
         else:
             raise ValueError("Invalid tree input: no root node found")
 
     # This does most of the heavy lifting in terms of setting up the 'WalkerTree' which is used to
     # calculate new positions of the nodes in the tree. Note that the underlying 'WalkerTree' is
-    # always created fresh here and saved into the instance variable '_w_tree'. For optimal
-    # performance, we could potentially squash the layers to avoid always creating a brand new inner
-    # tree, but that seems rather non-trivial and blends the concerns of the core algorithm with
-    # the API and outer layer tree structure.
+    # created here and saved into the instance variable '_w_tree' on initialization only, after
+    # which edits are applied to it in place (see '_apply_deltas').
     def _w_tree_setup(self):
         # Configure node-positioning tree
         conf = self._w_tree_config
@@ -245,40 +494,34 @@ class Bonsai:
         if not self._parent_id_to_children:
             return
 
-        # Sort children of each parent node by x-coordinate
-        for parent_id, children in self._parent_id_to_children.items():
-            self._parent_id_to_children[parent_id] = sorted(children, key=lambda c: c.pos.x)
-
-        # Add root node first as a special case since it has no parent
-        root_id = self._root_id()
-        root_children = self._parent_id_to_children[root_id]
-        root_first_child_id = root_children[0].id if root_children else None
-        nodes = {
-            WalkerNode(
-                node_id=root_id,
-                is_leaf=self._root_is_leaf(),
-                left_sibling_id=None,
-                right_sibling_id=None,
-                parent_id=None,
-                first_child_id=root_first_child_id,
-            )
-        }
-        # Build up Walker Tree using nodes augmented with "family" metadata
-        for parent_id, children in self._parent_id_to_children.items():
-            for i, child in enumerate(children):
-                left_sibling_id = children[i - 1].id if i > 0 else None
-                right_sibling_id = children[i + 1].id if i < len(children) - 1 else None
-                children_of_child = self._parent_id_to_children.get(child.id)
-                first_child_id = children_of_child[0].id if children_of_child else None
-                nodes.add(
-                    WalkerNode(
-                        node_id=child.id,
-                        is_leaf=child._is_leaf,
-                        left_sibling_id=left_sibling_id,
-                        right_sibling_id=right_sibling_id,
-                        parent_id=parent_id,
-                        first_child_id=first_child_id,
-                    )
-                )
-
-        self._w_tree.populate_tree(nodes)
+        # Sort children of each parent node by x-coordinate. This is only needed once since edits
+        # keep the children in order: new leaves are always added to the right of their siblings
+        # and removing a node does not reorder the rest.
+        by_x = attrgetter("pos.x")
+        for children in self._parent_id_to_children.values():
+            children.sort(key=by_x)
+
+        # Map node IDs to contiguous indices, adding the root node first as a special case since it
+        # has no parent. Each parent's children are laid out next to each other, in order, CSR-style:
+        # the children of group_parents[g] occupy indices group_starts[g] up to group_starts[g + 1].
+        # Every list is built in one go from the non-empty child groups, so each is sized up front
+        # rather than grown one element or group at a time.
+        root_id = self._root_id_cache
+        get_id = attrgetter("id")
+        groups = [(parent_id, children) for parent_id, children in self._parent_id_to_children.items() if children]
+        group_parent_ids = [parent_id for parent_id, _ in groups]
+        group_starts = list(accumulate((len(children) for _, children in groups), initial=1))
+        all_children = list(chain.from_iterable(children for _, children in groups))
+        node_ids = [root_id, *map(get_id, all_children)]
+        is_leaf = [self._root_is_leaf(), *map(attrgetter("_is_leaf"), all_children)]
+        self._child_index.update(
+            chain.from_iterable(zip(map(get_id, children), count()) for _, children in groups)
+        )
+        id_to_idx = dict(zip(node_ids, count()))
+        group_parents = [id_to_idx[parent_id] for parent_id in group_parent_ids]
+
+        # Build up Walker Tree "family" metadata as parallel lists, using -1 for missing links
+        parent, first_child, left_sibling, right_sibling = _fill_family_links(
+            group_parents, group_starts, len(node_ids)
+        )
+        self._w_tree.populate_tree_arrays(node_ids, is_leaf, parent, first_child, left_sibling, right_sibling)
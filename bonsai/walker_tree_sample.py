@@ -14,7 +14,7 @@ t = WalkerTree(
     max_depth=100,
     node_size=2,
 )
-nodes = {
+nodes = [
     WalkerNode(node_id="A", is_leaf=True, left_sibling_id=None, right_sibling_id="D", parent_id="E", first_child_id=None),
     WalkerNode(node_id="B", is_leaf=True, left_sibling_id=None, right_sibling_id="C", parent_id="D", first_child_id=None),
     WalkerNode(node_id="C", is_leaf=True, left_sibling_id="B", right_sibling_id=None, parent_id="D", first_child_id=None),
@@ -30,11 +30,12 @@ nodes = {
     WalkerNode(node_id="M", is_leaf=False, left_sibling_id="G", right_sibling_id=None, parent_id="N", first_child_id="H"),
     WalkerNode(node_id="N", is_leaf=False, left_sibling_id="F", right_sibling_id=None, parent_id="O", first_child_id="G"),
     WalkerNode(node_id="O", is_leaf=False, left_sibling_id=None, right_sibling_id=None, parent_id=None, first_child_id="E"),
-}
+]
 t.populate_tree(nodes)
 t.position_tree()
 
+positions = t.get_all_positions()
 node_ids = ["A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M", "N", "O"]
 for node_id in node_ids:
-    point = t.get_position(node_id)
+    point = positions[node_id]
     print("Node: {}, x: {}, y: {}".format(node_id, point.x, point.y))
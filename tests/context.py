@@ -2,4 +2,5 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from bonsai.bonsai import Node, Point, Bonsai
+from bonsai.bonsai import Node, Point, Bonsai, Config
+from bonsai._walker_tree import WalkerTree, WalkerNode
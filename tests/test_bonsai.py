@@ -2,9 +2,9 @@ import pytest
 from typing import DefaultDict, List
 from collections import defaultdict
 
-from bonsai.exceptions import InvalidTree, CannotPruneRoot
+from bonsai.exceptions import InvalidTree, CannotPruneRoot, NodeDoesNotExist, MaxDepthExceeded
 
-from .context import Node, Point, Bonsai
+from .context import Node, Point, Bonsai, Config, WalkerTree, WalkerNode
 
 
 def test_bonsai_initialization():
@@ -67,6 +67,18 @@ def test_bonsai_add_leaf_invalid():
     with pytest.raises(ValueError):
         bonsai.add_leaf("B", "A")
 
+def test_bonsai_add_leaf_duplicate_elsewhere_in_tree():
+    tree = defaultdict(list)
+    tree["A"] = [Node(id="B", pos=Point(0, 0)), Node(id="C", pos=Point(1, 0))]
+    tree["B"] = [Node(id="D", pos=Point(0, 1)), Node(id="E", pos=Point(1, 1))]
+    bonsai = Bonsai(tree)
+    with pytest.raises(ValueError):
+        bonsai.add_leaf("D", "C")
+    with pytest.raises(ValueError):
+        bonsai.add_leaf("A", "C")
+    with pytest.raises(NodeDoesNotExist):
+        bonsai.add_leaf("F", "X")
+
 def test_bonsai_no_nodes():
     tree = defaultdict(list)
     with pytest.raises(InvalidTree):
@@ -104,4 +116,159 @@ def test_bonsai_prune_root():
     bonsai = Bonsai(tree)
     with pytest.raises(CannotPruneRoot):
         bonsai.prune("A")
- 
\ No newline at end of file
+ 
+def test_bonsai_edits_match_fresh_tree():
+    tree = defaultdict(list)
+    tree["A"] = [Node(id="B", pos=Point(0, 0)), Node(id="C", pos=Point(1, 0))]
+    tree["B"] = [Node(id="D", pos=Point(0, 1)), Node(id="E", pos=Point(1, 1))]
+    bonsai = Bonsai(tree)
+    bonsai.add_leaf("F", "E")
+    bonsai.add_leaf("G", "F")
+    bonsai.add_leaf("H", "C")
+    bonsai.prune("D")
+    fresh_tree = defaultdict(list)
+    fresh_tree["A"] = [Node(id="B", pos=Point(0, 0)), Node(id="C", pos=Point(1, 0))]
+    fresh_tree["B"] = [Node(id="E", pos=Point(0, 1))]
+    fresh_tree["C"] = [Node(id="H", pos=Point(0, 1))]
+    fresh_tree["E"] = [Node(id="F", pos=Point(0, 2))]
+    fresh_tree["F"] = [Node(id="G", pos=Point(0, 3))]
+    fresh = Bonsai(fresh_tree)
+    by_id = lambda n: n.id
+    assert sorted(bonsai.list_nodes(), key=by_id) == sorted(fresh.list_nodes(), key=by_id)
+
+def test_bonsai_iter_nodes():
+    tree = defaultdict(list)
+    tree["A"] = [Node(id="B", pos=Point(0, 0)), Node(id="C", pos=Point(1, 0))]
+    tree["B"] = [Node(id="D", pos=Point(0, 1)), Node(id="E", pos=Point(1, 1))]
+    bonsai = Bonsai(tree)
+    assert list(bonsai.iter_nodes()) == bonsai.list_nodes()
+
+def test_bonsai_add_leaves_and_prune_many():
+    tree = defaultdict(list)
+    tree["A"] = [Node(id="B", pos=Point(0, 0)), Node(id="C", pos=Point(1, 0))]
+    tree["B"] = [Node(id="D", pos=Point(0, 1)), Node(id="E", pos=Point(1, 1))]
+    bonsai = Bonsai(tree)
+    bonsai.add_leaves([("F", "E"), ("G", "F"), ("H", "C")])
+    bonsai.prune_many(["F", "G", "D"])
+    expected_tree = defaultdict(list)
+    expected_tree["A"] = [Node(id="B", pos=Point(0, 0)), Node(id="C", pos=Point(1, 0))]
+    expected_tree["B"] = [Node(id="D", pos=Point(0, 1)), Node(id="E", pos=Point(1, 1))]
+    expected = Bonsai(expected_tree)
+    expected.add_leaf("F", "E")
+    expected.add_leaf("G", "F")
+    expected.add_leaf("H", "C")
+    expected.prune("F")
+    expected.prune("D")
+    assert bonsai.list_nodes() == expected.list_nodes()
+
+def test_bonsai_batch_edit_errors_not_hidden_by_reposition():
+    tree = defaultdict(list)
+    tree["A"] = [Node(id="B", pos=Point(0, 0)), Node(id="C", pos=Point(1, 0))]
+    bonsai = Bonsai(tree, Config(max_depth=1))
+    # The first leaf is too deep to position, but the duplicate ID is the error to report
+    with pytest.raises(ValueError):
+        bonsai.add_leaves([("D", "B"), ("C", "A")])
+    with pytest.raises(CannotPruneRoot):
+        bonsai.prune_many(["C", "A"])
+    assert [node.id for node in bonsai.list_nodes()] == ["A", "B", "D"]
+
+def test_bonsai_list_nodes_after_edit():
+    tree = defaultdict(list)
+    tree["A"] = [Node(id="B", pos=Point(0, 0)), Node(id="C", pos=Point(1, 0))]
+    bonsai = Bonsai(tree)
+    nodes = bonsai.list_nodes()
+    nodes.pop()
+    assert len(bonsai.list_nodes()) == 3
+    bonsai.add_leaf("D", "C")
+    assert bonsai.list_nodes() == [
+        Node(id="A", pos=Point(0, 0), _is_leaf=False),
+        Node(id="B", pos=Point(-150.0, 275), _is_leaf=True),
+        Node(id="C", pos=Point(150.0, 275), _is_leaf=False),
+        Node(id="D", pos=Point(150.0, 550), _is_leaf=True),
+    ]
+
+def test_bonsai_list_nodes_returns_new_nodes():
+    tree = defaultdict(list)
+    tree["A"] = [Node(id="B", pos=Point(0, 0)), Node(id="C", pos=Point(1, 0))]
+    tree["B"] = [Node(id="D", pos=Point(0, 1))]
+    bonsai = Bonsai(tree)
+    expected = [(node.id, node.pos, node._is_leaf) for node in bonsai.list_nodes()]
+    nodes = {node.id: node for node in bonsai.list_nodes()}
+    nodes["C"].pos = Point(1000, 1000)
+    # Using a returned node as input to another tree marks it as a leaf there
+    Bonsai({"E": [nodes["B"]]})
+    assert nodes["B"]._is_leaf
+    assert [(node.id, node.pos, node._is_leaf) for node in bonsai.list_nodes()] == expected
+
+def test_bonsai_non_string_ids():
+    tree = defaultdict(list)
+    tree[1] = [Node(id="B", pos=Point(0, 0))]
+    with pytest.raises(ValueError):
+        Bonsai(tree)
+    tree = defaultdict(list)
+    tree["A"] = [Node(id="B", pos=Point(0, 0)), Node(id=2, pos=Point(1, 0))]
+    with pytest.raises(ValueError):
+        Bonsai(tree)
+
+def test_bonsai_list_positions():
+    tree = defaultdict(list)
+    tree["A"] = [Node(id="B", pos=Point(0, 0)), Node(id="C", pos=Point(1, 0))]
+    tree["B"] = [Node(id="D", pos=Point(0, 1)), Node(id="E", pos=Point(1, 1))]
+    bonsai = Bonsai(tree)
+    ids, xs, ys, is_leaf = bonsai.list_positions()
+    assert [
+        Node(id=node_id, pos=Point(x, y), _is_leaf=bool(leaf))
+        for node_id, x, y, leaf in zip(ids, xs, ys, is_leaf)
+    ] == bonsai.list_nodes()
+
+def test_bonsai_deep_tree():
+    depth = 5000
+    tree = defaultdict(list)
+    for i in range(depth):
+        tree[str(i)] = [Node(id=str(i + 1), pos=Point(0, 0))]
+    bonsai = Bonsai(tree, Config(max_depth=depth))
+    nodes = bonsai.list_nodes()
+    assert len(nodes) == depth + 1
+    assert nodes[-1] == Node(id=str(depth), pos=Point(0, depth * 275), _is_leaf=True)
+
+def test_bonsai_list_nodes_after_failed_edit():
+    tree = defaultdict(list)
+    tree["A"] = [Node(id="B", pos=Point(0, 0))]
+    bonsai = Bonsai(tree, Config(max_depth=1))
+    with pytest.raises(MaxDepthExceeded):
+        bonsai.add_leaf("C", "B")
+    # The new leaf was never positioned, so it is reported at the origin like any unpositioned node
+    nodes = bonsai.list_nodes()
+    assert [node.id for node in nodes] == ["A", "B", "C"]
+    assert nodes[-1] == Node(id="C", pos=Point(0, 0), _is_leaf=True)
+    ids, xs, ys, _ = bonsai.list_positions()
+    assert (ids[-1], xs[-1], ys[-1]) == ("C", 0, 0)
+
+def _walker_tree_abc():
+    # Root A with children B and C
+    w_tree = WalkerTree(50, 100, 275, 100, 250)
+    w_tree.populate_tree([
+        WalkerNode("A", False, None, None, None, "B"),
+        WalkerNode("B", True, None, "C", "A", None),
+        WalkerNode("C", True, "B", None, "A", None),
+    ])
+    return w_tree
+
+def test_walker_tree_remove_nodes_from_iterator():
+    w_tree = _walker_tree_abc()
+    w_tree.remove_nodes(node_id for node_id in ["C"])
+    assert not w_tree.has_node("C")
+
+def test_walker_tree_remove_nodes_without_relinking():
+    w_tree = _walker_tree_abc()
+    w_tree.remove_nodes(["C"])
+    # B still links to C as its right sibling
+    with pytest.raises(InvalidTree):
+        w_tree.position_tree()
+
+def test_walker_tree_update_nodes_unreachable():
+    w_tree = _walker_tree_abc()
+    # D claims A as its parent, but A's children never link to it
+    w_tree.update_nodes([WalkerNode("D", True, None, None, "A", None)])
+    with pytest.raises(InvalidTree):
+        w_tree.position_tree()